@@ -1,40 +1,89 @@
+import os
 import re
 import shutil
 import tkinter as tk
 from pathlib import Path
 from tkinter import filedialog, messagebox, ttk
 
-from PIL import ImageTk
+import tomli_w
 
 from payqr.qr import QRCodeGenerator
-from payqr.templates import TemplateManager
+from payqr.templates import TemplateManager, clear_template_cache
+
+_LABEL_SPLIT_RE = re.compile(r"([A-Z])")
+_CURRENCY_RE = re.compile(r"^([A-Z]{3})(.+)$")
+_SANITIZE_RE = re.compile(r"[^A-Za-z0-9_-]")
+_NON_DIGIT_RE = re.compile(r"\D")
+_AMOUNT_INPUT_RE = re.compile(r"^[\d,]*$")
+
+# Fields that should be read-only
+_READONLY_FIELDS = frozenset({"IdentificationCode", "Version", "CodeSet"})
+# Fixed fields live in config.toml and are never written to user templates
+_FIXED_FIELDS = _READONLY_FIELDS
+
+
+def _is_template_entry(entry: os.DirEntry) -> bool:
+    """Return True if a scandir entry is a .toml file (symlinks followed)."""
+    return entry.name.endswith(".toml") and entry.is_file()
+
+
+def _list_templates(directory: Path) -> list[Path]:
+    """Return the sorted .toml files in directory using a single scandir pass."""
+    with os.scandir(directory) as it:
+        return sorted(Path(e.path) for e in it if _is_template_entry(e))
+
+
+def _seed_user_templates(user_templates_dir: Path) -> None:
+    """Copy the bundled templates (except config.toml) into user_templates_dir."""
+    # Get bundled templates directory
+    bundled_templates = Path(__file__).parent.parent.parent / "templates"
+
+    user_templates_dir.mkdir(parents=True, exist_ok=True)
+    if bundled_templates.exists():
+        for template_file in _list_templates(bundled_templates):
+            if template_file.name != "config.toml":  # Skip config.toml
+                dest = user_templates_dir / template_file.name
+                if not dest.exists():
+                    shutil.copy2(template_file, dest)
+
+
+def _has_templates(directory: Path) -> bool:
+    """Return True if directory exists and holds a template other than config.toml.
+
+    Uses the same filter as _list_templates, so it agrees with what
+    PayQRApp will list.
+    """
+    try:
+        with os.scandir(directory) as it:
+            return any(_is_template_entry(e) and e.name != "config.toml" for e in it)
+    except FileNotFoundError:
+        return False
 
 
 def _ensure_user_templates_dir() -> Path:
     """Ensure ~/.payqr/templates/ exists and contains default templates.
 
+    Seeding runs once per install; afterwards a ~/.payqr/.initialized
+    sentinel skips the directory scan and only makes sure the directory
+    still exists.
+
     Returns the Path to ~/.payqr/templates/
     """
     user_payqr_dir = Path.home() / ".payqr"
     user_templates_dir = user_payqr_dir / "templates"
+    sentinel = user_payqr_dir / ".initialized"
 
-    # Get bundled templates directory
-    bundled_templates = Path(__file__).parent.parent.parent / "templates"
-
-    # Create directories if they don't exist
-    user_templates_dir.mkdir(parents=True, exist_ok=True)
-
-    # Copy templates if directory is empty (config.toml is always read from project)
-    template_files = list(user_templates_dir.glob("*.toml"))
+    if sentinel.exists():
+        user_templates_dir.mkdir(parents=True, exist_ok=True)
+        return user_templates_dir
 
-    if not template_files:
-        if bundled_templates.exists():
-            for template_file in bundled_templates.glob("*.toml"):
-                if template_file.name != "config.toml":  # Skip config.toml
-                    dest = user_templates_dir / template_file.name
-                    if not dest.exists():
-                        shutil.copy2(template_file, dest)
+    # Copy templates if directory is missing or empty (config.toml is always read from project)
+    if not _has_templates(user_templates_dir):
+        _seed_user_templates(user_templates_dir)
 
+    # Only mark setup as done once templates are actually in place
+    if _has_templates(user_templates_dir):
+        sentinel.touch()
     return user_templates_dir
 
 
@@ -56,10 +105,17 @@ class PayQRApp(ttk.Frame):
 
         # Discover templates from user directory
         self.templates_dir = _ensure_user_templates_dir()
-        self.template_files = sorted(self.templates_dir.glob("*.toml"))
+        self._template_files_cache = None
         self.template_names = [
             f.stem for f in self.template_files if f.name != "config.toml"
         ]
+        if not self.template_names:
+            # All user templates were removed; re-seed from the bundled ones
+            _seed_user_templates(self.templates_dir)
+            self._template_files_cache = None
+            self.template_names = [
+                f.stem for f in self.template_files if f.name != "config.toml"
+            ]
 
         # Load default template
         default_template = (
@@ -78,30 +134,60 @@ class PayQRApp(ttk.Frame):
         # Build UI
         self.vars = {}
         self._last_image = None
+        self._last_pil = None  # PIL image behind the current preview
+        self._last_payload = None  # Payload rendered into the current preview
         self.form_frame = None
+        self._field_widgets = {}  # key -> (label, widget, var, kind)
+        self.currency_var = None
+        self.amount_numeric_var = None
         self.modified_var = tk.BooleanVar(value=False)  # Track if template modified
         self.original_values = {}  # Store original template values
+        self._dirty_fields = set()  # Keys whose value differs from the original
+        self._modified_update_pending = False
         self.setup_ui()
         self._store_original_values()
 
+    @property
+    def template_files(self) -> list[Path]:
+        """Template files in the user directory, listed once until invalidated."""
+        if self._template_files_cache is None:
+            self._template_files_cache = _list_templates(self.templates_dir)
+        return self._template_files_cache
+
     @staticmethod
     def _format_label(table_name: str, key: str) -> str:
         """Format TOML table name with spaces and add key in parentheses."""
         # Insert spaces before uppercase letters (for PascalCase/camelCase)
-        spaced = re.sub(r"([A-Z])", r" \1", table_name).strip()
+        spaced = _LABEL_SPLIT_RE.sub(r" \1", table_name).strip()
         return f"{spaced} ({key}):"
 
     def _store_original_values(self):
         """Store current values as baseline for modification detection."""
         self.original_values = {k: v.get() for k, v in self.vars.items()}
+        self._dirty_fields.clear()
         self.modified_var.set(False)
 
-    def _check_modified(self, *args):
-        """Check if any field differs from original template values."""
-        modified = any(
-            self.vars[k].get() != self.original_values.get(k, "") for k in self.vars
-        )
-        self.modified_var.set(modified)
+    def _on_field_change(self, key: str, var: tk.StringVar):
+        """Record whether a single field differs from its original value.
+
+        Only the changed variable is read, so each keystroke costs one Tcl
+        round-trip regardless of how many fields the form has.
+        """
+        if var.get() != self.original_values.get(key, ""):
+            self._dirty_fields.add(key)
+        else:
+            self._dirty_fields.discard(key)
+        # Coalesce indicator updates from a burst of keystrokes into one
+        if not self._modified_update_pending:
+            self._modified_update_pending = True
+            self.after_idle(self._update_modified_var)
+
+    def _update_modified_var(self):
+        """Sync modified_var with the set of dirty fields."""
+        self._modified_update_pending = False
+        modified = bool(self._dirty_fields)
+        if self.modified_var.get() != modified:
+            self.modified_var.set(modified)
 
     def _validate_account_input(self, new_value: str) -> bool:
         """Validate beneficiary account number input (max 18 digits).
@@ -111,7 +197,7 @@ class PayQRApp(ttk.Frame):
         if new_value == "":
             return True
         # Remove non-digit characters for counting
-        digits_only = re.sub(r"\D", "", new_value)
+        digits_only = _NON_DIGIT_RE.sub("", new_value)
         return len(digits_only) <= 18
 
     def _validate_amount_input(self, new_value: str) -> bool:
@@ -123,7 +209,7 @@ class PayQRApp(ttk.Frame):
         if new_value == "":
             return True
         # Allow only digits and comma
-        if not re.match(r"^[\d,]*$", new_value):
+        if not _AMOUNT_INPUT_RE.match(new_value):
             return False
         # Allow at most one comma
         if new_value.count(",") > 1:
@@ -139,7 +225,7 @@ class PayQRApp(ttk.Frame):
         Example: "1234567890" -> "120000000034567890"
         """
         # Remove any non-digit characters
-        digits_only = re.sub(r"\D", "", account)
+        digits_only = _NON_DIGIT_RE.sub("", account)
 
         if len(digits_only) == 18:
             return digits_only
@@ -190,110 +276,7 @@ class PayQRApp(ttk.Frame):
         self.form_frame = ttk.LabelFrame(self, text="Payment Details", padding=8)
         self.form_frame.grid(row=1, column=0, sticky="nsew", padx=(0, 6))
 
-        # Fields that should be read-only
-        readonly_fields = {"IdentificationCode", "Version", "CodeSet"}
-
-        # Currency storage for Amount field
-        self.currency_var = None
-        self.amount_numeric_var = None
-
-        for idx, field in enumerate(self.template_mgr.get_fields()):
-            label_text = self._format_label(field["label"], field["key"])
-            ttk.Label(self.form_frame, text=label_text).grid(
-                row=idx, column=0, sticky="w", padx=4, pady=2
-            )
-
-            # Special handling for Amount field with currency
-            if field["label"] == "Amount":
-                # Parse currency and amount from value like "RSD9000,00"
-                value = field["value"]
-                currency = "RSD"
-                amount = value
-
-                # Try to extract currency code (first 3 letters)
-                import re
-
-                match = re.match(r"^([A-Z]{3})(.+)$", value)
-                if match:
-                    currency, amount = match.groups()
-
-                # Create frame for currency + amount
-                amount_frame = ttk.Frame(self.form_frame)
-                amount_frame.grid(row=idx, column=1, sticky="ew", padx=4, pady=2)
-
-                # Currency entry (read-only)
-                self.currency_var = tk.StringVar(value=currency)
-                currency_entry = ttk.Entry(
-                    amount_frame,
-                    textvariable=self.currency_var,
-                    style="Readonly.TEntry",
-                    state="readonly",
-                    width=5,
-                )
-                currency_entry.pack(side="left", padx=(0, 4))
-
-                # Amount entry
-                self.amount_numeric_var = tk.StringVar(value=amount)
-                amount_entry = ttk.Entry(
-                    amount_frame, textvariable=self.amount_numeric_var, width=30
-                )
-                amount_entry.pack(side="left", fill="x", expand=True)
-
-                # Add validation for amount format (comma as decimal separator)
-                vcmd_amount = (self.register(self._validate_amount_input), "%P")
-                amount_entry.config(validate="key", validatecommand=vcmd_amount)
-
-                # Store a combined var that concatenates currency + amount
-                combined_var = tk.StringVar(value=field["value"])
-                self.vars[field["key"]] = combined_var
-
-                # Trace changes to update combined value
-                def update_combined(*args):
-                    cv = self.currency_var.get() if self.currency_var else ""
-                    av = (
-                        self.amount_numeric_var.get() if self.amount_numeric_var else ""
-                    )
-                    combined_var.set(f"{cv}{av}")
-                    self._check_modified()
-
-                self.currency_var.trace_add("write", update_combined)
-                self.amount_numeric_var.trace_add("write", update_combined)
-
-                continue
-
-            var = tk.StringVar(value=field["value"])
-            self.vars[field["key"]] = var
-            var.trace_add("write", self._check_modified)
-
-            # Create entry with readonly state for fixed fields
-            if field["label"] in readonly_fields:
-                entry = ttk.Entry(
-                    self.form_frame,
-                    textvariable=var,
-                    width=40,
-                    style="Readonly.TEntry",
-                    state="readonly",
-                )
-            else:
-                entry = ttk.Entry(self.form_frame, textvariable=var, width=40)
-
-                # Add validation and auto-padding for beneficiary account number
-                if field["key"] == "R":
-                    # Register validation command to limit to 18 digits
-                    vcmd = (self.register(self._validate_account_input), "%P")
-                    entry.config(validate="key", validatecommand=vcmd)
-
-                    def on_account_focus_out(event, v=var):
-                        current = v.get()
-                        padded = self._pad_account_number(current)
-                        if current != padded:
-                            v.set(padded)
-
-                    entry.bind("<FocusOut>", on_account_focus_out)
-
-            entry.grid(row=idx, column=1, sticky="ew", padx=4, pady=2)
-
-        self.form_frame.columnconfigure(1, weight=1)
+        self._populate_form()
 
         # Actions and preview
         actions = ttk.Frame(self)
@@ -320,6 +303,160 @@ class PayQRApp(ttk.Frame):
         self.preview_label.grid(row=0, column=0, sticky="nsew")
         self.form_frame.columnconfigure(1, weight=1)
 
+    @staticmethod
+    def _field_kind(field: dict) -> str:
+        """Classify a field by the kind of widget it needs."""
+        if field["label"] == "Amount":
+            return "amount"
+        if field["label"] in _READONLY_FIELDS:
+            return "readonly"
+        return "entry"
+
+    def _populate_form(self):
+        """Sync the entry widgets in form_frame with the current template.
+
+        Widgets for fields shared with the previous template are reused and
+        only their label and value are updated; fields that disappeared are
+        destroyed and new ones are created.
+        """
+        fields = self.template_mgr.get_fields()
+        new_kinds = {field["key"]: self._field_kind(field) for field in fields}
+
+        # Drop widgets that the new template doesn't need (or needs differently)
+        for key, (label, widget, _var, kind) in list(self._field_widgets.items()):
+            if new_kinds.get(key) != kind:
+                label.destroy()
+                widget.destroy()
+                del self._field_widgets[key]
+                del self.vars[key]
+                if kind == "amount":
+                    self.currency_var = None
+                    self.amount_numeric_var = None
+
+        for idx, field in enumerate(fields):
+            key = field["key"]
+            label_text = self._format_label(field["label"], key)
+            if key in self._field_widgets:
+                label, widget, var, kind = self._field_widgets[key]
+                if kind == "amount":
+                    currency, amount = self._split_amount(field["value"])
+                    self.currency_var.set(currency)
+                    self.amount_numeric_var.set(amount)
+                # For Amount this resets the combined var to the raw value,
+                # matching a freshly created widget
+                var.set(field["value"])
+            else:
+                widgets = self._create_field_widgets(field)
+                self._field_widgets[key] = widgets
+                label, widget, var, kind = widgets
+
+            label.config(text=label_text)
+            label.grid(row=idx, column=0, sticky="w", padx=4, pady=2)
+            widget.grid(row=idx, column=1, sticky="ew", padx=4, pady=2)
+            # Restack in field order so Tab traversal follows the rows
+            label.lift()
+            widget.lift()
+
+        self.form_frame.columnconfigure(1, weight=1)
+
+    @staticmethod
+    def _split_amount(value: str) -> tuple[str, str]:
+        """Split a value like "RSD9000,00" into currency and amount."""
+        # Try to extract currency code (first 3 letters)
+        match = _CURRENCY_RE.match(value)
+        if match:
+            return match.group(1), match.group(2)
+        return "RSD", value
+
+    def _create_field_widgets(self, field: dict):
+        """Create the label, entry widget and variable for a single field.
+
+        Returns a (label, widget, var, kind) tuple; gridding is left to the caller.
+        """
+        form = self.form_frame
+        kind = self._field_kind(field)
+        label = ttk.Label(form)
+
+        # Special handling for Amount field with currency
+        if kind == "amount":
+            # Parse currency and amount from value like "RSD9000,00"
+            currency, amount = self._split_amount(field["value"])
+
+            # Create frame for currency + amount
+            amount_frame = ttk.Frame(form)
+
+            # Currency entry (read-only)
+            self.currency_var = tk.StringVar(value=currency)
+            currency_entry = ttk.Entry(
+                amount_frame,
+                textvariable=self.currency_var,
+                style="Readonly.TEntry",
+                state="readonly",
+                width=5,
+            )
+            currency_entry.pack(side="left", padx=(0, 4))
+
+            # Amount entry
+            self.amount_numeric_var = tk.StringVar(value=amount)
+            amount_entry = ttk.Entry(
+                amount_frame, textvariable=self.amount_numeric_var, width=30
+            )
+            amount_entry.pack(side="left", fill="x", expand=True)
+
+            # Add validation for amount format (comma as decimal separator)
+            vcmd_amount = (self.register(self._validate_amount_input), "%P")
+            amount_entry.config(validate="key", validatecommand=vcmd_amount)
+
+            # Store a combined var that concatenates currency + amount
+            combined_var = tk.StringVar(value=field["value"])
+            self.vars[field["key"]] = combined_var
+
+            # Trace changes to update combined value
+            def update_combined(*args):
+                cv = self.currency_var.get() if self.currency_var else ""
+                av = self.amount_numeric_var.get() if self.amount_numeric_var else ""
+                combined_var.set(f"{cv}{av}")
+                self._on_field_change(field["key"], combined_var)
+
+            self.currency_var.trace_add("write", update_combined)
+            self.amount_numeric_var.trace_add("write", update_combined)
+
+            return label, amount_frame, combined_var, kind
+
+        var = tk.StringVar(value=field["value"])
+        self.vars[field["key"]] = var
+        var.trace_add(
+            "write", lambda *_, k=field["key"], v=var: self._on_field_change(k, v)
+        )
+
+        # Create entry with readonly state for fixed fields
+        if kind == "readonly":
+            entry = ttk.Entry(
+                form,
+                textvariable=var,
+                width=40,
+                style="Readonly.TEntry",
+                state="readonly",
+            )
+        else:
+            entry = ttk.Entry(form, textvariable=var, width=40)
+
+            # Add validation and auto-padding for beneficiary account number
+            if field["key"] == "R":
+                # Register validation command to limit to 18 digits
+                vcmd = (self.register(self._validate_account_input), "%P")
+                entry.config(validate="key", validatecommand=vcmd)
+
+                def on_account_focus_out(event, v=var):
+                    current = v.get()
+                    padded = self._pad_account_number(current)
+                    if current != padded:
+                        v.set(padded)
+
+                entry.bind("<FocusOut>", on_account_focus_out)
+
+        return label, entry, var, kind
+
     def payload(self) -> str:
         overrides = {k: v.get() for k, v in self.vars.items()}
 
@@ -331,7 +468,7 @@ class PayQRApp(ttk.Frame):
 
     def _save_template_if_modified(self):
         """Auto-save template if it has been modified."""
-        if not self.modified_var.get():
+        if not self._dirty_fields:
             return
 
         try:
@@ -373,9 +510,7 @@ class PayQRApp(ttk.Frame):
                         )
                         return
                     # Sanitize name
-                    import re
-
-                    sanitized = re.sub(r"[^A-Za-z0-9_-]", "_", name)
+                    sanitized = _SANITIZE_RE.sub("_", name)
                     if sanitized in self.template_names:
                         messagebox.showerror(
                             "Error",
@@ -422,42 +557,43 @@ class PayQRApp(ttk.Frame):
 
             template_path = self.templates_dir / f"{template_name}.toml"
 
-            # Build TOML content with current values
-            lines = ["# Variable fields\n"]
+            # Build template data from current values; fixed fields are
+            # skipped (they're in config.toml)
+            data = {}
             for field in self.template_mgr.get_fields():
-                label = field["label"]
-                key = field["key"]
-                # Skip fixed fields (they're in config.toml)
-                if label in ("IdentificationCode", "Version", "CodeSet"):
+                if field["label"] in _FIXED_FIELDS:
                     continue
-
-                # Get current value from GUI
-                value = self.vars[key].get()
-                desc = field.get("description", "")
-
-                lines.append(f"\n[{label}]\n")
-                lines.append(f'key = "{key}"\n')
-                lines.append(f'value = "{value}"\n')
-                lines.append("required = true\n")
-                if desc:
-                    lines.append(f'description = "{desc}"\n')
-
-            # Write file
-            template_path.write_text("".join(lines), encoding="utf-8")
+                table = {
+                    "key": field["key"],
+                    "value": self.vars[field["key"]].get(),
+                    "required": True,
+                }
+                if field.get("description"):
+                    table["description"] = field["description"]
+                data[field["label"]] = table
+
+            # Write file; tomli_w takes care of quoting and escaping values
+            content = "# Variable fields\n" + tomli_w.dumps(data)
+            template_path.write_bytes(content.encode("utf-8"))
+            clear_template_cache()
+            # Directory contents may have changed; re-list on next access
+            self._template_files_cache = None
+
+            # Keep the loaded template in sync without re-reading it from disk
+            self.template_mgr.update_values(
+                {table["key"]: table["value"] for table in data.values()}
+            )
 
             # If we saved as a new template, switch to it
             if template_name != self.current_template:
                 self.current_template = template_name
                 # Refresh template list
-                self.template_files = sorted(self.templates_dir.glob("*.toml"))
                 self.template_names = [
                     f.stem for f in self.template_files if f.name != "config.toml"
                 ]
                 self.template_combo["values"] = self.template_names
                 self.template_combo.set(template_name)
-                # Reload the template manager with new file
-                template_path = self.templates_dir / f"{template_name}.toml"
-                self.template_mgr = TemplateManager(str(template_path))
+                self.template_mgr.template_path = str(template_path)
 
             # Update stored values and clear modified flag
             self._store_original_values()
@@ -478,11 +614,18 @@ class PayQRApp(ttk.Frame):
 
     def on_generate(self):
         try:
+            # Deferred: PIL's Tk bridge is only needed once a preview is shown
+            from PIL import ImageTk
+
             # Generate QR code with current values first
             payload = self.payload()
-            img = self.qr.generate_qr_image(payload)
-            self._last_image = ImageTk.PhotoImage(img)
-            self.preview_label.configure(image=self._last_image)
+            # The preview already shows this payload; skip the PhotoImage rebuild
+            if payload != self._last_payload:
+                img = self.qr.generate_qr_image(payload)
+                self._last_image = ImageTk.PhotoImage(img)
+                self._last_pil = img
+                self._last_payload = payload
+                self.preview_label.configure(image=self._last_image)
 
             # Then auto-save if modified
             self._save_template_if_modified()
@@ -499,13 +642,17 @@ class PayQRApp(ttk.Frame):
             )
             if not path:
                 return
-            self.qr.generate_and_save(payload, path)
+            if self._last_pil is not None and self._last_payload == payload:
+                # Reuse the image already shown in the preview
+                self.qr.save_image(self._last_pil, path)
+            else:
+                self.qr.generate_and_save(payload, path)
             messagebox.showinfo("Saved", f"QR saved to\n{path}")
         except Exception as e:
             messagebox.showerror("Error", str(e))
 
     def on_template_change(self, event=None):
-        """Handle template selection change: reload fields and rebuild the form."""
+        """Handle template selection change: reload fields and update the form."""
         selected = self.template_combo.get()
         if not selected:
             return
@@ -517,100 +664,9 @@ class PayQRApp(ttk.Frame):
             messagebox.showerror("Error", f"Failed to load template: {e}")
             return
 
-        # Rebuild form
-        if self.form_frame is not None:
-            self.form_frame.destroy()
-
-        self.vars = {}
-        self.currency_var = None
-        self.amount_numeric_var = None
-
-        self.form_frame = ttk.LabelFrame(self, text="Payment Details", padding=8)
-        self.form_frame.grid(row=1, column=0, sticky="nsew", padx=(0, 6))
-
-        readonly_fields = {"IdentificationCode", "Version", "CodeSet"}
-
-        for idx, field in enumerate(self.template_mgr.get_fields()):
-            label_text = self._format_label(field["label"], field["key"])
-            ttk.Label(self.form_frame, text=label_text).grid(
-                row=idx, column=0, sticky="w", padx=4, pady=2
-            )
-
-            if field["label"] == "Amount":
-                value = field["value"]
-                currency = "RSD"
-                amount = value
-                match = re.match(r"^([A-Z]{3})(.+)$", value)
-                if match:
-                    currency, amount = match.groups()
-
-                amount_frame = ttk.Frame(self.form_frame)
-                amount_frame.grid(row=idx, column=1, sticky="ew", padx=4, pady=2)
-
-                self.currency_var = tk.StringVar(value=currency)
-                currency_entry = ttk.Entry(
-                    amount_frame,
-                    textvariable=self.currency_var,
-                    style="Readonly.TEntry",
-                    state="readonly",
-                    width=5,
-                )
-                currency_entry.pack(side="left", padx=(0, 4))
-
-                self.amount_numeric_var = tk.StringVar(value=amount)
-                amount_entry = ttk.Entry(
-                    amount_frame, textvariable=self.amount_numeric_var, width=30
-                )
-                amount_entry.pack(side="left", fill="x", expand=True)
-
-                # Add validation for amount format (comma as decimal separator)
-                vcmd_amount = (self.register(self._validate_amount_input), "%P")
-                amount_entry.config(validate="key", validatecommand=vcmd_amount)
-
-                combined_var = tk.StringVar(value=field["value"])
-                self.vars[field["key"]] = combined_var
-
-                def update_combined(*_):
-                    cv = self.currency_var.get() if self.currency_var else ""
-                    av = (
-                        self.amount_numeric_var.get() if self.amount_numeric_var else ""
-                    )
-                    combined_var.set(f"{cv}{av}")
-                    self._check_modified()
-
-                self.currency_var.trace_add("write", update_combined)
-                self.amount_numeric_var.trace_add("write", update_combined)
-                continue
-
-            var = tk.StringVar(value=field["value"])
-            self.vars[field["key"]] = var
-            var.trace_add("write", self._check_modified)
-            if field["label"] in readonly_fields:
-                entry = ttk.Entry(
-                    self.form_frame,
-                    textvariable=var,
-                    width=40,
-                    style="Readonly.TEntry",
-                    state="readonly",
-                )
-            else:
-                entry = ttk.Entry(self.form_frame, textvariable=var, width=40)
-
-                # Add validation and auto-padding for beneficiary account number
-                if field["key"] == "R":
-                    # Register validation command to limit to 18 digits
-                    vcmd = (self.register(self._validate_account_input), "%P")
-                    entry.config(validate="key", validatecommand=vcmd)
-
-                    def on_account_focus_out(event, v=var):
-                        current = v.get()
-                        padded = self._pad_account_number(current)
-                        if current != padded:
-                            v.set(padded)
-
-                    entry.bind("<FocusOut>", on_account_focus_out)
-
-            entry.grid(row=idx, column=1, sticky="ew", padx=4, pady=2)
-
-        self.form_frame.columnconfigure(1, weight=1)
+        # Update the form in place; StringVar writes mark fields dirty, so
+        # reset the baseline afterwards
+        self._populate_form()
         self._store_original_values()
+        # Force the next Generate to rebuild the preview for the new template
+        self._last_payload = None
@@ -1,5 +1,14 @@
-import qrcode
-from PIL import Image
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+# qrcode and PIL pull in many submodules; they are imported on first use so
+# the GUI window can appear before they are loaded.
+
+# QR codes are 1-bit images; heavy zlib compression buys almost nothing.
+# Only applied to .png paths; other formats are picked by PIL from the extension
+_PNG_SAVE_OPTIONS = {"optimize": False, "compress_level": 1}
 
 
 class QRCodeGenerator:
@@ -14,8 +23,14 @@ class QRCodeGenerator:
         self.border = border
         self.error_correction = error_correction
         self.fixed_size = fixed_size  # (width, height) or None
+        # Built lazily by _get_qr() and reused across calls
+        self._qr = None
+        self._ec = None
+        self._resample = None
 
     def _ec_level(self):
+        import qrcode
+
         mapping = {
             "L": qrcode.constants.ERROR_CORRECT_L,
             "M": qrcode.constants.ERROR_CORRECT_M,
@@ -26,26 +41,70 @@ class QRCodeGenerator:
             self.error_correction.upper(), qrcode.constants.ERROR_CORRECT_L
         )
 
-    def generate_qr_image(self, data: str) -> Image.Image:
-        qr = qrcode.QRCode(
-            version=None,
-            error_correction=self._ec_level(),
-            box_size=self.box_size,
-            border=self.border,
-        )
+    def _get_qr(self):
+        """Return the shared QRCode instance, importing qrcode on first use."""
+        if self._qr is None:
+            import qrcode
+            from PIL import Image
+
+            self._ec = self._ec_level()
+            self._resample = Image.Resampling.LANCZOS
+            self._qr = qrcode.QRCode(
+                version=None,
+                error_correction=self._ec,
+                box_size=self.box_size,
+                border=self.border,
+            )
+        return self._qr
+
+    def _qr_obj(self, data: str):
+        """Encode data into the shared QRCode instance and return it."""
+        qr = self._get_qr()
+        qr.clear()
+        # Reset version so best fit starts over instead of from the last payload
+        qr.version = None
         qr.add_data(data)
         qr.make(fit=True)
+        return qr
+
+    def generate_qr_image(self, data: str) -> "Image.Image":
+        qr = self._qr_obj(data)
+        if self.fixed_size:
+            # Pick the largest box size that still fits, so the final resize
+            # only has to cover the remainder
+            total_modules = qr.modules_count + 2 * self.border
+            qr.box_size = max(1, min(self.fixed_size) // total_modules)
+        else:
+            qr.box_size = self.box_size
         img = qr.make_image(fill_color="black", back_color="white")
         # qrcode returns a PilImage wrapper; get actual PIL Image
         pil_img = img.get_image() if hasattr(img, "get_image") else img
 
         # Resize to fixed size if specified
-        if self.fixed_size:
-            pil_img = pil_img.resize(self.fixed_size, Image.Resampling.LANCZOS)
+        if self.fixed_size and pil_img.size != tuple(self.fixed_size):
+            pil_img = pil_img.resize(self.fixed_size, self._resample)
 
         return pil_img
 
     def generate_and_save(self, data: str, output_path: str) -> str:
-        img = self.generate_qr_image(data)
-        img.save(output_path)
+        if self.fixed_size is None:
+            # No resize needed: let qrcode write the image directly
+            qr = self._qr_obj(data)
+            qr.box_size = self.box_size
+            img = qr.make_image(fill_color="black", back_color="white")
+            # Save the underlying PIL image: the qrcode wrapper forces PNG
+            pil_img = img.get_image() if hasattr(img, "get_image") else img
+            return self.save_image(pil_img, output_path)
+        return self.save_image(self.generate_qr_image(data), output_path)
+
+    def save_image(self, img: "Image.Image", output_path: str) -> str:
+        """Write an already generated QR image, fast-encoding 1-bit PNGs."""
+        if img.mode != "1":
+            from PIL import Image
+
+            img = img.convert("1", dither=Image.Dither.NONE)
+        if str(output_path).lower().endswith(".png"):
+            img.save(output_path, **_PNG_SAVE_OPTIONS)
+        else:
+            img.save(output_path)
         return output_path
@@ -1,9 +1,61 @@
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import tomllib
 
 
+@lru_cache(maxsize=64)
+def _load_toml_cached(path: str, mtime_ns: int) -> dict:
+    """Parse a TOML file once per (path, mtime) and reuse the result.
+
+    The returned dict is shared between callers and must not be mutated.
+    """
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+
+@lru_cache(maxsize=64)
+def _merge_config_and_template(
+    config_key: tuple[str, int], template_key: tuple[str, int]
+) -> dict:
+    """Merge config (fixed fields + settings) with template (variable fields).
+
+    Keys are (path, mtime_ns) pairs so the merge is redone only when either
+    file changes on disk.
+    """
+    config = _load_toml_cached(*config_key)
+    template = _load_toml_cached(*template_key)
+    merged = {}
+    # Copy rendering settings from config
+    for key in ("separator", "kv_sep", "trim_empty"):
+        if key in config:
+            merged[key] = config[key]
+
+    # Add fixed fields from config first (preserves order)
+    for label, item in config.items():
+        if label not in ("separator", "kv_sep", "trim_empty"):
+            if isinstance(item, dict) and ("key" in item or "value" in item):
+                merged[label] = item
+
+    # Add variable fields from template
+    for label, item in template.items():
+        if isinstance(item, dict) and ("key" in item or "value" in item):
+            merged[label] = item
+
+    return merged
+
+
+def clear_template_cache() -> None:
+    """Drop cached parses, e.g. after writing a template file.
+
+    mtime alone can miss rewrites on filesystems with coarse timestamps.
+    """
+    _load_toml_cached.cache_clear()
+    _merge_config_and_template.cache_clear()
+
+
 class TemplateManager:
     def __init__(self, template_path: str):
         self.template_path = template_path
@@ -11,36 +63,21 @@ class TemplateManager:
         # Always read from bundled templates, not from user directory
         config_path = Path(__file__).parent.parent.parent / "templates" / "config.toml"
 
-        self._config = self._load_toml(str(config_path))
-        # Load template (variable fields)
-        self._template = self._load_toml(template_path)
-        # Merge: config fields first, then template fields
-        self._cfg = self._merge_config_and_template()
-
-    def _load_toml(self, path: str) -> dict:
-        with open(path, "rb") as f:
-            return tomllib.load(f)
-
-    def _merge_config_and_template(self) -> dict:
-        """Merge config (fixed fields + settings) with template (variable fields)."""
-        merged = {}
-        # Copy rendering settings from config
-        for key in ("separator", "kv_sep", "trim_empty"):
-            if key in self._config:
-                merged[key] = self._config[key]
-
-        # Add fixed fields from config first (preserves order)
-        for label, item in self._config.items():
-            if label not in ("separator", "kv_sep", "trim_empty"):
-                if isinstance(item, dict) and ("key" in item or "value" in item):
-                    merged[label] = item
-
-        # Add variable fields from template
-        for label, item in self._template.items():
-            if isinstance(item, dict) and ("key" in item or "value" in item):
-                merged[label] = item
-
-        return merged
+        config_key = (str(config_path), os.stat(config_path).st_mtime_ns)
+        template_key = (template_path, os.stat(template_path).st_mtime_ns)
+        # Load and merge: config fields first, then template fields
+        self._cfg = _merge_config_and_template(config_key, template_key)
+        # Normalize fields once; the merged config never changes afterwards
+        self._fields = self._build_fields()
+        # Pre-join each key with kv_sep so rendering a field is a single concat;
+        # kept alongside the fields so get_fields() returns the documented shape
+        kv_sep = self.kv_sep
+        self._prefixed_fields: List[Tuple[str, Dict[str, str]]] = [
+            (f"{item['key']}{kv_sep}", item) for item in self._fields
+        ]
+        self._field_keys = frozenset(item["key"] for item in self._fields)
+        # The payload without overrides depends only on the template defaults
+        self._base_payload = self._render_no_overrides()
 
     @property
     def separator(self) -> str:
@@ -56,7 +93,17 @@ class TemplateManager:
 
     def get_fields(self) -> List[Dict[str, str]]:
         """
-        Return ordered field dicts for rendering: [{key, value, label?, required?, pattern?}].
+        Return ordered field dicts for rendering.
+
+        Each dict has the shape {key, value, label?, required?, pattern?,
+        description?}. The list is built once in __init__ and shared with
+        the caller, not copied.
+        """
+        return self._fields
+
+    def _build_fields(self) -> List[Dict[str, str]]:
+        """
+        Normalize the merged config into an ordered list of field dicts.
 
         Supports three TOML shapes:
         1) Array of tables: [[fields]]
@@ -69,8 +116,9 @@ class TemplateManager:
         # 1) [[fields]]
         fields = cfg.get("fields")
         if isinstance(fields, list):
-            # Assume items are already dicts with the right keys
-            return list(fields)
+            # Assume items are already dicts with the right keys; copy them so
+            # the cached parse result is never shared with callers
+            return [dict(item) for item in fields]
 
         # 2) [fields.Label]
         if isinstance(fields, dict):
@@ -88,6 +136,8 @@ class TemplateManager:
                         normalized["required"] = item["required"]
                     if "pattern" in item:
                         normalized["pattern"] = item["pattern"]
+                    if "description" in item:
+                        normalized["description"] = item["description"]
                     result.append(normalized)
             if result:
                 return result
@@ -107,10 +157,34 @@ class TemplateManager:
                     normalized["required"] = item["required"]
                 if "pattern" in item:
                     normalized["pattern"] = item["pattern"]
+                if "description" in item:
+                    normalized["description"] = item["description"]
                 result.append(normalized)
 
         return result
 
+    def update_values(self, values: Dict[str, str]) -> None:
+        """Replace field values in memory, e.g. after the template was saved.
+
+        Fields whose key is not in values keep their current value.
+        """
+        for item in self._fields:
+            if item["key"] in values:
+                item["value"] = values[item["key"]]
+        self._base_payload = self._render_no_overrides()
+
+    def _render_no_overrides(self) -> str:
+        """Render the payload from template defaults only."""
+        trim_empty = self.trim_empty
+        out: List[str] = []
+        for prefix, item in self._prefixed_fields:
+            value = item.get("value", "")
+            value = "" if value is None else str(value)
+            if trim_empty and value == "":
+                continue
+            out.append(prefix + value)
+        return self.separator.join(out)
+
     def render_payload(
         self, overrides: Optional[Dict[str, str]] = None, include_extras: bool = True
     ) -> str:
@@ -120,27 +194,32 @@ class TemplateManager:
         - overrides: mapping of key->value to replace defaults
         - include_extras: if True, include overrides for keys not in template at the end
         """
-        overrides = overrides or {}
-        out: List[str] = []
-        seen: set[str] = set()
-
-        for item in self.get_fields():
-            field_key = item["key"]
-            name = field_key
-            value = overrides.get(field_key, item.get("value", ""))
-            if value is None:
-                value = ""
-            if self.trim_empty and str(value) == "":
+        if not overrides:
+            return self._base_payload
+
+        kv_sep = self.kv_sep
+        separator = self.separator
+        trim_empty = self.trim_empty
+        fields = self._prefixed_fields
+        field_keys = self._field_keys
+        extras = [k for k in overrides if k not in field_keys] if include_extras else []
+        # Size the output once; trimmed fields just leave unused slots at the end
+        out: List[Optional[str]] = [None] * (len(fields) + len(extras))
+        i = 0
+
+        for prefix, item in fields:
+            value = overrides.get(item["key"], item.get("value", ""))
+            value = "" if value is None else str(value)
+            if trim_empty and value == "":
                 continue
-            out.append(f"{name}{self.kv_sep}{value}")
-            seen.add(field_key)
+            out[i] = prefix + value
+            i += 1
 
-        if include_extras:
-            for k, v in overrides.items():
-                if k in seen:
-                    continue
-                if self.trim_empty and (v is None or str(v) == ""):
-                    continue
-                out.append(f"{k}{self.kv_sep}{v}")
+        for k in extras:
+            v = overrides[k]
+            if trim_empty and (v is None or str(v) == ""):
+                continue
+            out[i] = f"{k}{kv_sep}{v}"
+            i += 1
 
-        return self.separator.join(out)
+        return separator.join(out[:i])